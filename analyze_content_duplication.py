@@ -3,97 +3,91 @@
 内容重复分析工具
 分析标题和正文内容的重复问题
 """
-import json
 import re
-from typing import Dict, List, Any, Tuple
-from difflib import SequenceMatcher
-from collections import defaultdict
+from collections import Counter
+from sync_state import iter_synced_topics
 
+# 常见的标题开头词
+COMMON_PATTERNS = (
+    '近期', '最近', '今天', '昨天', '刚刚', '分享',
+    '推荐', '发现', '看到', '听说', '觉得', '认为'
+)
+_COMMON_PREFIX_RE = re.compile(r'^ ?(' + '|'.join(map(re.escape, COMMON_PATTERNS)) + ')')
 
-def load_sync_state() -> Dict[str, Any]:
-    """加载同步状态文件"""
-    try:
-        with open('sync_state.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {"synced_topics": {}}
 
-
-def similarity(a: str, b: str) -> float:
-    """计算两个字符串的相似度"""
-    return SequenceMatcher(None, a, b).ratio()
+def _first_token(title: str) -> str:
+    """获取标题的第一个词（移除前导空格），无分隔时取前5个字符"""
+    clean_title = title.lstrip(' ')
+    parts = clean_title.split(maxsplit=1)
+    return parts[0] if parts else clean_title[:5]
 
 
 def analyze_title_content_duplication():
     """分析标题和正文内容重复问题"""
     print("🔍 开始分析标题和内容重复问题...")
     
-    sync_state = load_sync_state()
-    synced_topics = sync_state.get('synced_topics', {})
-    
-    print(f"\n📊 数据概览:")
-    print(f"- 已同步内容数量: {len(synced_topics)}")
-    
+    total = 0
     duplication_issues = []
+    issue_stats = Counter()
     
-    for topic_id, info in synced_topics.items():
+    for topic_id, info in iter_synced_topics():
+        total += 1
         title = info.get('title', '').strip()
         if not title:
             continue
         
-        # 分析标题特征
-        issue = {
-            'topic_id': topic_id,
-            'wordpress_id': info.get('wordpress_id'),
-            'title': title,
-            'title_length': len(title),
-            'sync_time': info.get('sync_time'),
-            'issues': []
-        }
+        # 分析标题特征，仅在发现问题时才构建记录
+        issues = []
+        title_length = len(title)
         
         # 1. 检查标题是否被截断
-        if title.endswith('…') or title.endswith('...'):
-            issue['issues'].append('标题被截断')
+        if title.endswith(('…', '...')):
+            issues.append('标题被截断')
         
         # 2. 检查标题是否以空格开头
         if title.startswith(' '):
-            issue['issues'].append('标题以空格开头')
+            issues.append('标题以空格开头')
             
         # 3. 检查标题长度
-        if len(title) < 10:
-            issue['issues'].append('标题过短')
-        elif len(title) > 50:
-            issue['issues'].append('标题过长')
+        if title_length < 10:
+            issues.append('标题过短')
+        elif title_length > 50:
+            issues.append('标题过长')
         
         # 4. 检查是否包含正文内容
         # 如果标题包含"。"或包含完整句子，可能是正文内容被当作标题
-        if '。' in title or ('，' in title and len(title) > 30):
-            issue['issues'].append('标题包含正文内容')
+        if '。' in title or ('，' in title and title_length > 30):
+            issues.append('标题包含正文内容')
         
         # 5. 检查重复的开头模式
-        common_patterns = [
-            '近期', '最近', '今天', '昨天', '刚刚', '分享',
-            '推荐', '发现', '看到', '听说', '觉得', '认为'
-        ]
-        for pattern in common_patterns:
-            if title.startswith(f' {pattern}') or title.startswith(pattern):
-                issue['issues'].append(f'标题以常见词"{pattern}"开头')
-                break
+        match = _COMMON_PREFIX_RE.match(title)
+        if match:
+            issues.append(f'标题以常见词"{match.group(1)}"开头')
         
-        if issue['issues']:
-            duplication_issues.append(issue)
+        if issues:
+            duplication_issues.append({
+                'topic_id': topic_id,
+                'wordpress_id': info.get('wordpress_id'),
+                'title': title,
+                'title_length': title_length,
+                'sync_time': info.get('sync_time'),
+                'issues': issues
+            })
+            # 按问题类型分类统计
+            issue_stats.update(issues)
     
-    # 按问题类型分类统计
-    issue_stats = defaultdict(int)
-    for item in duplication_issues:
-        for issue_type in item['issues']:
-            issue_stats[issue_type] += 1
+    print(f"\n📊 数据概览:")
+    print(f"- 已同步内容数量: {total}")
+    
+    if not total:
+        print("\n✅ 没有已同步的内容，跳过分析")
+        return duplication_issues, issue_stats, total
     
     print(f"\n⚠️  发现的问题:")
-    print(f"- 有问题的内容数量: {len(duplication_issues)} / {len(synced_topics)} ({len(duplication_issues)/len(synced_topics)*100:.1f}%)")
+    print(f"- 有问题的内容数量: {len(duplication_issues)} / {total} ({len(duplication_issues)/total*100:.1f}%)")
     
     print(f"\n📋 问题类型统计:")
-    for issue_type, count in sorted(issue_stats.items(), key=lambda x: x[1], reverse=True):
+    for issue_type, count in issue_stats.most_common():
         print(f"- {issue_type}: {count} 条")
     
     print(f"\n🔍 具体问题示例:")
@@ -102,38 +96,30 @@ def analyze_title_content_duplication():
         print(f"  标题: '{item['title']}'")
         print(f"  问题: {', '.join(item['issues'])}")
     
-    return duplication_issues, issue_stats
+    return duplication_issues, issue_stats, total
 
 
 def analyze_content_patterns():
     """分析内容生成模式"""
     print(f"\n🏷️  内容生成模式分析:")
     
-    sync_state = load_sync_state()
-    synced_topics = sync_state.get('synced_topics', {})
-    
-    titles = [info.get('title', '').strip() for info in synced_topics.values()]
+    titles = [info.get('title', '').strip() for _, info in iter_synced_topics()]
+    if not titles:
+        print("- 没有可分析的标题")
+        return
     
     # 分析标题开头词汇
-    start_words = defaultdict(int)
-    for title in titles:
-        if title:
-            # 移除前导空格并获取第一个词
-            clean_title = title.lstrip(' ')
-            if clean_title:
-                first_word = clean_title.split()[0] if clean_title.split() else clean_title[:5]
-                start_words[first_word] += 1
+    start_words = Counter(_first_token(title) for title in titles if title.strip(' '))
     
     print(f"\n📊 标题开头词频统计（出现2次以上）:")
-    for word, count in sorted(start_words.items(), key=lambda x: x[1], reverse=True):
-        if count >= 2:
-            print(f"  '{word}': {count} 次")
+    for word, count in start_words.most_common():
+        if count < 2:
+            break
+        print(f"  '{word}': {count} 次")
     
     # 分析标题长度分布
-    length_distribution = defaultdict(int)
-    for title in titles:
-        length_range = (len(title) // 10) * 10
-        length_distribution[f"{length_range}-{length_range + 9}"] += 1
+    length_ranges = ((len(title) // 10) * 10 for title in titles)
+    length_distribution = Counter(f"{start}-{start + 9}" for start in length_ranges)
     
     print(f"\n📏 标题长度分布:")
     for length_range, count in sorted(length_distribution.items()):
@@ -165,13 +151,13 @@ if __name__ == "__main__":
     print("🔍 ZSXQ to WordPress 内容重复分析工具")
     print("=" * 60)
     
-    duplication_issues, issue_stats = analyze_title_content_duplication()
+    duplication_issues, issue_stats, total = analyze_title_content_duplication()
     analyze_content_patterns()
     suggest_improvements()
     
     print(f"\n" + "=" * 60)
     print("📈 分析总结:")
-    print(f"- 总内容数: {len(load_sync_state().get('synced_topics', {}))}")
+    print(f"- 总内容数: {total}")
     print(f"- 存在问题的内容: {len(duplication_issues)}")
     print(f"- 主要问题: 标题截断 ({issue_stats.get('标题被截断', 0)} 条)")
     print(f"- 需要优化标题生成逻辑和配置参数")
@@ -3,22 +3,11 @@
 标题重复分析工具
 分析主题、文章、片刻是否存在标题重复问题
 """
-import json
 import os
+import sys
 from collections import Counter, defaultdict
-from typing import Dict, List, Any
-import requests
 from config_manager import Config
-from wordpress_client import WordPressClient
-
-
-def load_sync_state() -> Dict[str, Any]:
-    """加载同步状态文件"""
-    try:
-        with open('sync_state.json', 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return {"synced_topics": {}}
+from sync_state import iter_synced_topics
 
 
 def analyze_title_duplicates():
@@ -26,18 +15,15 @@ def analyze_title_duplicates():
     print("🔍 开始分析标题重复情况...")
     
     # 1. 分析sync_state.json中的标题
-    sync_state = load_sync_state()
-    synced_topics = sync_state.get('synced_topics', {})
-    
-    print(f"\n📊 同步状态文件分析:")
-    print(f"- 已同步主题数量: {len(synced_topics)}")
-    
     # 提取标题
+    total = 0
     titles = []
     title_to_ids = defaultdict(list)
     
-    for topic_id, info in synced_topics.items():
-        title = info.get('title', '').strip()
+    for topic_id, info in iter_synced_topics():
+        total += 1
+        # 驻留标题字符串，重复标题在Counter和字典中共享同一对象
+        title = sys.intern(info.get('title', '').strip())
         if title:
             titles.append(title)
             title_to_ids[title].append({
@@ -46,6 +32,9 @@ def analyze_title_duplicates():
                 'sync_time': info.get('sync_time')
             })
     
+    print(f"\n📊 同步状态文件分析:")
+    print(f"- 已同步主题数量: {total}")
+    
     # 统计标题重复情况
     title_counts = Counter(titles)
     duplicates = {title: count for title, count in title_counts.items() if count > 1}
@@ -67,6 +56,9 @@ def analyze_title_duplicates():
     # 2. 通过WordPress API分析发布内容
     try:
         print(f"\n🔗 WordPress内容分析:")
+        # 延迟导入：仅在需要连接WordPress时加载XML-RPC依赖
+        from wordpress_client import WordPressClient
+        
         config = Config()
         wp_client = WordPressClient(config)
         
@@ -79,46 +71,62 @@ def analyze_title_duplicates():
     except Exception as e:
         print(f"WordPress分析失败: {e}")
     
-    # 3. 分析标题格式
-    print(f"\n📝 标题格式分析:")
-    short_titles = [title for title in titles if len(title.strip()) < 20]
-    long_titles = [title for title in titles if len(title.strip()) >= 50]
-    placeholder_titles = [title for title in titles if title.strip() in ['', ' ', '无标题']]
+    # 3. 分析标题格式（单次遍历统计所有格式指标）
+    short_count = long_count = placeholder_count = 0
+    space_prefix_count = truncated_count = 0
+    short_examples = []
+    truncated_examples = []
+    
+    for title in titles:
+        length = len(title)
+        if length < 20:
+            short_count += 1
+            if len(short_examples) < 5:
+                short_examples.append(title)
+        elif length >= 50:
+            long_count += 1
+        if title in ('', ' ', '无标题'):
+            placeholder_count += 1
+        if title.startswith(' '):
+            space_prefix_count += 1
+        if title.endswith(('…', '...')):
+            truncated_count += 1
+            if len(truncated_examples) < 3:
+                truncated_examples.append(title)
     
-    print(f"- 短标题（<20字符）: {len(short_titles)} 个")
-    print(f"- 长标题（≥50字符）: {len(long_titles)} 个")
-    print(f"- 占位标题: {len(placeholder_titles)} 个")
+    print(f"\n📝 标题格式分析:")
+    print(f"- 短标题（<20字符）: {short_count} 个")
+    print(f"- 长标题（≥50字符）: {long_count} 个")
+    print(f"- 占位标题: {placeholder_count} 个")
     
-    if short_titles[:5]:
+    if short_examples:
         print("   短标题示例:")
-        for title in short_titles[:5]:
+        for title in short_examples:
             print(f"     '{title}'")
     
     # 4. 分析标题生成模式
     print(f"\n🏷️  标题生成模式分析:")
     
     # 分析以空格开头的标题
-    space_prefix_titles = [title for title in titles if title.startswith(' ')]
-    print(f"- 以空格开头的标题: {len(space_prefix_titles)} 个")
+    print(f"- 以空格开头的标题: {space_prefix_count} 个")
     
     # 分析截断标题（以...结尾）
-    truncated_titles = [title for title in titles if title.endswith('…') or title.endswith('...')]
-    print(f"- 被截断的标题: {len(truncated_titles)} 个")
+    print(f"- 被截断的标题: {truncated_count} 个")
     
-    if truncated_titles[:3]:
+    if truncated_examples:
         print("   截断标题示例:")
-        for title in truncated_titles[:3]:
+        for title in truncated_examples:
             print(f"     '{title}'")
     
     return {
         'total_titles': len(titles),
         'unique_titles': len(title_counts),
         'duplicates': duplicates,
-        'short_titles': len(short_titles),
-        'long_titles': len(long_titles),
-        'placeholder_titles': len(placeholder_titles),
-        'space_prefix_titles': len(space_prefix_titles),
-        'truncated_titles': len(truncated_titles)
+        'short_titles': short_count,
+        'long_titles': long_count,
+        'placeholder_titles': placeholder_count,
+        'space_prefix_titles': space_prefix_count,
+        'truncated_titles': truncated_count
     }
 
 
@@ -161,7 +169,9 @@ if __name__ == "__main__":
     print(f"\n" + "=" * 60)
     print("📈 分析总结:")
     print(f"- 已同步内容: {results['total_titles']} 条")
-    print(f"- 标题去重率: {results['unique_titles']}/{results['total_titles']} ({results['unique_titles']/results['total_titles']*100:.1f}%)")
+    total_titles = results['total_titles']
+    unique_rate = results['unique_titles'] / total_titles * 100 if total_titles else 0.0
+    print(f"- 标题去重率: {results['unique_titles']}/{total_titles} ({unique_rate:.1f}%)")
     
     if results['duplicates']:
         print(f"- ⚠️  发现 {len(results['duplicates'])} 个重复标题")
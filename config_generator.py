@@ -9,74 +9,95 @@
 import json
 import sys
 from typing import Dict, List, Any, Optional
-from zsxq_client import ZsxqClient
 import logging
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+# 配置文件模板（只读，使用时通过 _CONFIG_TEMPLATE_JSON 生成独立副本）
+CONFIG_TEMPLATE = {
+    "zsxq": {
+        "access_token": "",
+        "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+        "group_id": ""
+    },
+    "wordpress": {
+        "url": "",
+        "username": "",
+        "password": "",
+        "verify_ssl": True
+    },
+    "qiniu": {
+        "access_key": "",
+        "secret_key": "",
+        "bucket": "",
+        "domain": ""
+    },
+    "sync": {
+        "batch_size": 20,
+        "delay_seconds": 2,
+        "max_retries": 5
+    },
+    "source": {
+        "name": "",
+        "url": ""
+    },
+    "content_mapping": {
+        "enable_type_mapping": True,
+        "article_types": ["article"],
+        "topic_types": ["talk", "q&a-question", "q&a-answer"],
+        "topic_settings": {
+            "category": "主题",
+            "max_title_length": 30,
+            "use_custom_post_type": True,
+            "title_prefix": "",
+            "sync_title": False
+        },
+        "article_settings": {
+            "category": "文章",
+            "sync_title": True
+        },
+        "enable_column_mapping": True,
+        "column_sync_mode": "all",
+        "columns": {},
+        "auto_discover_columns": True,
+        "special_categories": {
+            "digested": "精华",
+            "sticky": "置顶"
+        },
+        "post_types": {
+            "article": "post",
+            "topic": "post"
+        }
+    }
+}
+_CONFIG_TEMPLATE_JSON = json.dumps(CONFIG_TEMPLATE)
+
+# 配置文件必填字段
+REQUIRED_FIELDS = (
+    ("zsxq", "access_token"),
+    ("zsxq", "group_id"),
+    ("wordpress", "url"),
+    ("wordpress", "username"),
+    ("wordpress", "password"),
+)
+
+
+def _dig(data: Any, path: tuple) -> Any:
+    """按键路径读取嵌套字典中的值，任一层缺失时返回None"""
+    for key in path:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+        if data is None:
+            return None
+    return data
+
+
 class ConfigGenerator:
     """配置生成助手"""
     
-    def __init__(self):
-        self.config_template = {
-            "zsxq": {
-                "access_token": "",
-                "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-                "group_id": ""
-            },
-            "wordpress": {
-                "url": "",
-                "username": "",
-                "password": "",
-                "verify_ssl": True
-            },
-            "qiniu": {
-                "access_key": "",
-                "secret_key": "",
-                "bucket": "",
-                "domain": ""
-            },
-            "sync": {
-                "batch_size": 20,
-                "delay_seconds": 2,
-                "max_retries": 5
-            },
-            "source": {
-                "name": "",
-                "url": ""
-            },
-            "content_mapping": {
-                "enable_type_mapping": True,
-                "article_types": ["article"],
-                "topic_types": ["talk", "q&a-question", "q&a-answer"],
-                "topic_settings": {
-                    "category": "主题",
-                    "max_title_length": 30,
-                    "use_custom_post_type": True,
-                    "title_prefix": "",
-                    "sync_title": False
-                },
-                "article_settings": {
-                    "category": "文章",
-                    "sync_title": True
-                },
-                "enable_column_mapping": True,
-                "column_sync_mode": "all",
-                "columns": {},
-                "auto_discover_columns": True,
-                "special_categories": {
-                    "digested": "精华",
-                    "sticky": "置顶"
-                },
-                "post_types": {
-                    "article": "post",
-                    "topic": "post"
-                }
-            }
-        }
-    
     def discover_columns(self, access_token: str, group_id: str) -> Dict[str, str]:
         """自动发现专栏信息
         
@@ -90,6 +111,9 @@ class ConfigGenerator:
         try:
             logger.info("🔍 正在自动发现知识星球专栏...")
             
+            # 延迟导入：仅在需要访问知识星球API时加载网络依赖
+            from zsxq_client import ZsxqClient
+            
             # 创建临时客户端
             client = ZsxqClient(access_token, "Mozilla/5.0", group_id)
             
@@ -122,6 +146,7 @@ class ConfigGenerator:
         try:
             logger.info("📡 正在获取知识星球信息...")
             
+            from zsxq_client import ZsxqClient
             client = ZsxqClient(access_token, "Mozilla/5.0", group_id)
             
             # 这里可以扩展获取星球名称等信息
@@ -144,7 +169,8 @@ class ConfigGenerator:
         print("🚀 ZSXQToWordpress 配置生成助手")
         print("=" * 50)
         
-        config = self.config_template.copy()
+        # 从模板生成独立副本，避免嵌套字典被修改后污染模板
+        config = json.loads(_CONFIG_TEMPLATE_JSON)
         
         # 1. 知识星球配置
         print("\n📱 知识星球配置")
@@ -252,8 +278,9 @@ class ConfigGenerator:
             output_path: 输出文件路径
         """
         try:
+            content = json.dumps(config, ensure_ascii=False, indent=2)
             with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(config, f, ensure_ascii=False, indent=2)
+                f.write(content)
             
             print(f"\n✅ 配置文件已生成: {output_path}")
             print("\n📋 下一步操作:")
@@ -278,22 +305,9 @@ class ConfigGenerator:
                 config = json.load(f)
             
             # 检查必要字段
-            required_fields = [
-                "zsxq.access_token",
-                "zsxq.group_id", 
-                "wordpress.url",
-                "wordpress.username",
-                "wordpress.password"
-            ]
-            
-            for field in required_fields:
-                keys = field.split('.')
-                value = config
-                for key in keys:
-                    value = value.get(key, {})
-                
-                if not value:
-                    logger.error(f"❌ 必要字段 {field} 未配置")
+            for path in REQUIRED_FIELDS:
+                if not _dig(config, path):
+                    logger.error(f"❌ 必要字段 {'.'.join(path)} 未配置")
                     return False
             
             logger.info("✅ 配置文件验证通过")
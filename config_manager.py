@@ -10,6 +10,24 @@ from typing import Dict, Any, Optional
 import logging
 
 
+# 可通过环境变量覆盖的配置项: (环境变量名, (配置段, 键名))
+ENV_OVERRIDES = (
+    # 知识星球配置
+    ('ZSXQ_ACCESS_TOKEN', ('zsxq', 'access_token')),
+    ('ZSXQ_GROUP_ID', ('zsxq', 'group_id')),
+    # WordPress配置
+    ('WORDPRESS_URL', ('wordpress', 'url')),
+    ('WORDPRESS_USERNAME', ('wordpress', 'username')),
+    ('WORDPRESS_PASSWORD', ('wordpress', 'password')),
+    ('WORDPRESS_VERIFY_SSL', ('wordpress', 'verify_ssl')),
+    # 七牛云配置
+    ('QINIU_ACCESS_KEY', ('qiniu', 'access_key')),
+    ('QINIU_SECRET_KEY', ('qiniu', 'secret_key')),
+    ('QINIU_BUCKET', ('qiniu', 'bucket')),
+    ('QINIU_DOMAIN', ('qiniu', 'domain')),
+)
+
+
 class ConfigError(Exception):
     """配置相关的错误"""
     pass
@@ -30,12 +48,11 @@ class Config:
         
     def load(self) -> None:
         """加载配置文件"""
-        if not os.path.exists(self.config_path):
-            raise ConfigError(f"配置文件不存在: {self.config_path}")
-            
         try:
             with open(self.config_path, 'r', encoding='utf-8') as f:
                 self._config = json.load(f)
+        except FileNotFoundError:
+            raise ConfigError(f"配置文件不存在: {self.config_path}")
         except json.JSONDecodeError as e:
             raise ConfigError(f"配置文件格式错误: {e}")
         except Exception as e:
@@ -48,49 +65,21 @@ class Config:
     
     def _apply_env_overrides(self) -> None:
         """应用环境变量覆盖配置"""
-        # 知识星球配置
-        if 'ZSXQ_ACCESS_TOKEN' in os.environ:
-            self._config.setdefault('zsxq', {})['access_token'] = os.environ['ZSXQ_ACCESS_TOKEN']
-            self.logger.info("使用环境变量 ZSXQ_ACCESS_TOKEN")
-        
-        if 'ZSXQ_GROUP_ID' in os.environ:
-            self._config.setdefault('zsxq', {})['group_id'] = os.environ['ZSXQ_GROUP_ID']
-            self.logger.info("使用环境变量 ZSXQ_GROUP_ID")
+        env = os.environ
+        config = self._config
         
-        # WordPress配置
-        if 'WORDPRESS_URL' in os.environ:
-            self._config.setdefault('wordpress', {})['url'] = os.environ['WORDPRESS_URL']
-            self.logger.info("使用环境变量 WORDPRESS_URL")
-            
-        if 'WORDPRESS_USERNAME' in os.environ:
-            self._config.setdefault('wordpress', {})['username'] = os.environ['WORDPRESS_USERNAME']
-            self.logger.info("使用环境变量 WORDPRESS_USERNAME")
-            
-        if 'WORDPRESS_PASSWORD' in os.environ:
-            self._config.setdefault('wordpress', {})['password'] = os.environ['WORDPRESS_PASSWORD']
-            self.logger.info("使用环境变量 WORDPRESS_PASSWORD")
-        
-        if 'WORDPRESS_VERIFY_SSL' in os.environ:
-            value = os.environ['WORDPRESS_VERIFY_SSL'].lower()
-            self._config.setdefault('wordpress', {})['verify_ssl'] = value not in ['false', '0', 'no']
-            self.logger.info(f"使用环境变量 WORDPRESS_VERIFY_SSL: {value}")
-        
-        # 七牛云配置
-        if 'QINIU_ACCESS_KEY' in os.environ:
-            self._config.setdefault('qiniu', {})['access_key'] = os.environ['QINIU_ACCESS_KEY']
-            self.logger.info("使用环境变量 QINIU_ACCESS_KEY")
-            
-        if 'QINIU_SECRET_KEY' in os.environ:
-            self._config.setdefault('qiniu', {})['secret_key'] = os.environ['QINIU_SECRET_KEY']
-            self.logger.info("使用环境变量 QINIU_SECRET_KEY")
-            
-        if 'QINIU_BUCKET' in os.environ:
-            self._config.setdefault('qiniu', {})['bucket'] = os.environ['QINIU_BUCKET']
-            self.logger.info("使用环境变量 QINIU_BUCKET")
+        for env_name, (section, key) in ENV_OVERRIDES:
+            if env_name not in env:
+                continue
             
-        if 'QINIU_DOMAIN' in os.environ:
-            self._config.setdefault('qiniu', {})['domain'] = os.environ['QINIU_DOMAIN']
-            self.logger.info("使用环境变量 QINIU_DOMAIN")
+            value = env[env_name]
+            if key == 'verify_ssl':
+                value = value.lower()
+                config.setdefault(section, {})[key] = value not in ['false', '0', 'no']
+                self.logger.info(f"使用环境变量 {env_name}: {value}")
+            else:
+                config.setdefault(section, {})[key] = value
+                self.logger.info(f"使用环境变量 {env_name}")
         
     def _validate(self) -> None:
         """验证配置的必要字段"""
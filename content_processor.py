@@ -2,18 +2,92 @@
 """
 内容处理模块
 负责将知识星球内容转换为WordPress格式
+
+性能说明：本模块均为纯文本变换，耗时主要来自中间字符串的分配和字典查找，
+属于内存带宽受限的工作负载。优化应着眼于减少扫描次数和中间字符串
+（合并正则、按需跳过、一次性拼接），SIMD/JIT（如Numba）对字符串和正则处理无益。
 """
 import re
 import logging
-import urllib.parse
-from urllib.parse import urlparse
+from functools import lru_cache
+from urllib.parse import unquote, urlparse
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
 
+# 知识星球实体标签：@提及、图片、话题、链接，一次扫描统一处理
+_RE_ENTITY_TAG = re.compile(r'<e type="mention"[^>]*>(@[^<]+)</e>|<e type="(image|hashtag|web)"[^>]*>')
+# 文本格式标签 <e type="text_bold" title="..." />，以及其他以title开头的e标签
+_RE_TEXT_FORMAT_TAG = re.compile(r'<e type="([^"]*)" title="([^"]*)"[^>]*/>')
+# 文本格式标签类型 -> Markdown格式标记，其他类型只保留文本
+_TEXT_FORMAT_MARKERS = {
+    'text_bold': '**',
+    'text_italic': '*',
+    'text_delete': '~~',
+}
+
+# 主题类型 -> 保存正文的字段名；其他类型使用content字段
+_TEXT_KEY_BY_TYPE = {
+    'talk': 'talk',
+    'q&a-question': 'question',
+    'q&a-answer': 'answer',
+}
+
+# 知识星球文章链接中的topic_id
+_RE_TOPIC_URL_ID = re.compile(r'/topics/(\d+)')
+# 图片标签的src属性
+_RE_SRC_ATTR = re.compile(r'src="([^"]*)"')
+# 中文句末标点，用于切分句子
+_RE_SENTENCE_END = re.compile(r'[。！？]')
+# HTML标签
+_RE_HTML_TAG = re.compile(r'<[^>]*>')
+# 话题标签 <e type="hashtag" title="%23标签%23" /> 和普通的 #标签#
+_RE_HASHTAG_HTML = re.compile(r'<e type="hashtag"[^>]*title="([^"]*)"[^>]*/?>')
+_RE_HASHTAG_PLAIN = re.compile(r'#([^#\s]+)#')
+# e标签的href/title属性
+_RE_HREF_ATTR = re.compile(r'href="([^"]*)"')
+_RE_TITLE_ATTR = re.compile(r'title="([^"]*)"')
+# 标点符号，模糊匹配标题时去除
+_RE_PUNCTUATION = re.compile(r'[^\w\s]')
+
+# 知识星球页脚：“—— 发布于 …”、“— 发布于 …”或“发布于 …”
+_RE_ZSXQ_FOOTER = re.compile(
+    r'(?:——?\s*)?发布于\s*.+?\s+\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\s*', re.MULTILINE
+)
+
+# 标题结尾的句读标点：以这些字符结尾的行不像标题，截断后也无需补省略号
+_TITLE_END_PUNCTUATION = frozenset('。！？，、')
+
+# 长标题截断的候选断点，按优先级排列
+_TITLE_BREAKPOINTS = ('：', ':', '，', '、', ' ', '-', '－')
+
+# 图片文件扩展名（元组形式，可直接传给str.endswith一次判断）
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg', '.ico')
+# URL中任意位置出现图片扩展名，与_IMAGE_EXTENSIONS保持一致
+_RE_IMAGE_EXTENSION = re.compile(r'\.(?:jpe?g|png|gif|bmp|webp|svg|ico)')
+
+# 常见的图片服务域名或路径模式
+_IMAGE_URL_HINTS = (
+    'qpic.cn',           # 知识星球图片域名
+    'images.',           # 常见图片子域名
+    'img.',              # 常见图片子域名
+    '/images/',          # 图片路径
+    '/img/',             # 图片路径
+    'imagecdn.',         # 图片CDN
+    'imgcdn.',           # 图片CDN
+)
+
+# 文末附加图片的段落模板，每个图片独立成段
+_IMG_PARAGRAPH_TEMPLATE = '\n\n<p><img src="%s" alt="图片"></p>'
+
+
+@lru_cache(maxsize=4096)
 def parse_datetime_safe(date_string: str) -> datetime:
     """安全解析日期时间字符串，处理各种时区格式
     
+    同一主题的create_time会在生成标题、添加来源页脚和增量同步过滤中
+    多次解析，结果按字符串缓存（datetime为不可变对象，可安全共享）。
+    
     Args:
         date_string: 日期时间字符串
         
@@ -23,19 +97,14 @@ def parse_datetime_safe(date_string: str) -> datetime:
     if not date_string:
         raise ValueError("日期字符串不能为空")
     
-    # 处理Z结尾的UTC时间
+    # 处理Z结尾的UTC时间（只替换末尾的Z，无需扫描整个字符串）
     if date_string.endswith('Z'):
-        date_string = date_string.replace('Z', '+00:00')
+        date_string = date_string[:-1] + '+00:00'
     
     # 处理+HHMM格式的时区，转换为+HH:MM格式
-    # 匹配形如 +0800 或 -0800 的时区格式
-    tz_pattern = r'([+-])(\d{2})(\d{2})$'
-    match = re.search(tz_pattern, date_string)
-    if match:
-        sign, hours, minutes = match.groups()
-        # 替换为标准格式 +HH:MM
-        standard_tz = f'{sign}{hours}:{minutes}'
-        date_string = re.sub(tz_pattern, standard_tz, date_string)
+    # 时区固定位于末尾5个字符（形如 +0800 或 -0800），按位置判断即可
+    if len(date_string) >= 5 and date_string[-5] in '+-' and date_string[-4:].isdecimal():
+        date_string = f'{date_string[:-2]}:{date_string[-2:]}'
     
     try:
         return datetime.fromisoformat(date_string)
@@ -57,29 +126,22 @@ class ContentProcessor:
         self.config = config or {}
         self.zsxq_client = zsxq_client
         
-        # 预编译常用正则表达式以提升性能
-        self._re_mention = re.compile(r'<e type="mention"[^>]*>(@[^<]+)</e>')
-        self._re_hashtag = re.compile(r'<e type="hashtag"[^>]*>#([^<]+)#</e>')
-        self._re_web_link = re.compile(r'<e type="web"[^>]*/>')
-        self._re_image_link = re.compile(r'<e type="image"[^>]*/>')  # 新增图片标签处理
-        self._re_text_bold = re.compile(r'<e type="text_bold" title="([^"]*)"[^>]*/>')
-        self._re_text_italic = re.compile(r'<e type="text_italic" title="([^"]*)"[^>]*/>')
-        self._re_text_delete = re.compile(r'<e type="text_delete" title="([^"]*)"[^>]*/>')
-        self._re_text_generic = re.compile(r'<e type="[^"]*" title="([^"]*)"[^>]*/>')
-        self._re_html_tags = re.compile(r'<[^>]*>')
-        self._re_whitespace = re.compile(r'\s+')
-        self._re_hashtag_html = re.compile(r'<e type="hashtag"[^>]*title="([^"]*)"[^>]*/?>')
-        self._re_hashtag_plain = re.compile(r'#([^#\s]+)#')
-        self._re_href = re.compile(r'href="([^"]*)"')
-        self._re_title = re.compile(r'title="([^"]*)"')
-        self._re_punctuation = re.compile(r'[^\w\s]')
-        
-        # 知识星球页脚匹配模式
-        self._re_footer_patterns = [
-            re.compile(r'——\s*发布于\s*.+?\s+\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\s*', re.MULTILINE),
-            re.compile(r'—\s*发布于\s*.+?\s+\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\s*', re.MULTILINE),
-            re.compile(r'发布于\s*.+?\s+\d{4}-\d{2}-\d{2}\s+\d{2}:\d{2}:\d{2}\s*', re.MULTILINE),
-        ]
+        # 处理过程中不变的配置项，初始化时解析一次
+        sync_config = self.config.get('sync', {})
+        self._default_sync_title = sync_config.get('sync_title', True)
+        self._add_source_footer = sync_config.get('add_source_footer', False)
+        self._keep_raw_data = sync_config.get('keep_raw_data', False)
+        source_config = self.config.get('source', {})
+        self._source_name = source_config.get('name', '知识星球')
+        self._source_url = source_config.get('url', '')
+        content_mapping = self.config.get('content_mapping', {})
+        self._content_mapping = content_mapping
+        self._article_settings = content_mapping.get('article_settings', {})
+        self._topic_settings = content_mapping.get('topic_settings', {})
+        self._post_types = content_mapping.get('post_types', {})
+        self._special_categories = content_mapping.get('special_categories', {})
+        self._topic_max_title_length = self._topic_settings.get('max_title_length', 30)
+        self._topic_title_prefix = self._topic_settings.get('title_prefix', '[主题]')
         
     def process_topic(self, topic: Dict[str, Any]) -> Dict[str, Any]:
         """处理单个主题，转换为WordPress内容格式（支持文章和片刻）
@@ -146,6 +208,34 @@ class ContentProcessor:
         # 默认为片刻
         return 'short_content'
     
+    def _get_text_key(self, topic: Dict[str, Any]) -> Optional[str]:
+        """获取主题中保存正文的字段名
+        
+        Args:
+            topic: 主题数据
+            
+        Returns:
+            字段名（talk/question/answer/content），没有正文字段时返回None
+        """
+        text_key = _TEXT_KEY_BY_TYPE.get(topic.get('type', ''))
+        if text_key is not None and text_key in topic:
+            return text_key
+        if 'content' in topic:
+            return 'content'
+        return None
+    
+    def _get_text(self, topic: Dict[str, Any]) -> str:
+        """获取主题正文
+        
+        Args:
+            topic: 主题数据
+            
+        Returns:
+            正文文本，没有正文时返回空字符串
+        """
+        text_key = self._get_text_key(topic)
+        return topic[text_key].get('text', '') if text_key else ''
+    
     def _process_article(self, topic: Dict[str, Any]) -> Dict[str, Any]:
         """处理文章内容（保留原有逻辑）
         
@@ -158,13 +248,13 @@ class ContentProcessor:
         topic_id = str(topic.get('topic_id', ''))
         topic_type = topic.get('type', '')
         
-        # 根据主题类型获取内容
-        text_content = ''
+        # 根据主题类型获取内容（摘要正文同时用于提取标签）
+        summary_text = self._get_text(topic)
+        text_content = summary_text
         has_article_link = False
         
         if topic_type == 'talk' and 'talk' in topic:
             talk_data = topic['talk']
-            text_content = talk_data.get('text', '')
             
             # 检查是否有文章链接，如果有则获取完整文章内容
             if 'article' in talk_data and talk_data['article'] and self.zsxq_client:
@@ -175,8 +265,7 @@ class ContentProcessor:
                     has_article_link = True
                     try:
                         # 从文章URL中提取topic_id
-                        import re
-                        topic_id_match = re.search(r'/topics/(\d+)', article_url)
+                        topic_id_match = _RE_TOPIC_URL_ID.search(article_url)
                         if topic_id_match:
                             article_topic_id = topic_id_match.group(1)
                             self.logger.info(f"检测到文章链接，获取完整内容: {article_topic_id}")
@@ -195,44 +284,37 @@ class ContentProcessor:
                                         
                     except Exception as e:
                         self.logger.warning(f"获取文章详情失败: {e}，使用原始摘要内容")
-                        
-        elif topic_type == 'q&a-question' and 'question' in topic:
-            text_content = topic['question'].get('text', '')
-        elif topic_type == 'q&a-answer' and 'answer' in topic:
-            text_content = topic['answer'].get('text', '')
-        elif 'content' in topic:
-            text_content = topic['content'].get('text', '')
         
         # 处理标题 - 根据文章配置决定是否同步标题
-        article_settings = self.config.get('content_mapping', {}).get('article_settings', {})
+        article_settings = self._article_settings
         sync_title = article_settings.get('sync_title')
         
         # 向后兼容：如果新配置不存在，使用旧的全局配置
         if sync_title is None:
-            sync_title = self.config.get('sync', {}).get('sync_title', True)
+            sync_title = self._default_sync_title
             
+        title_source_line = None
         if sync_title:
-            title = self._generate_title(topic)
+            title, title_source_line = self._generate_title(topic)
         else:
             # 不同步标题时使用配置中的占位标题
             placeholder_title = article_settings.get('placeholder_title', '无标题')
             title = placeholder_title
         
-        # 处理内容 - 传递标题以便去重
-        processed_content = self._process_content(text_content, title)
+        # 处理内容 - 传递标题及其来源行以便去重
+        processed_content = self._process_content(text_content, title, title_source_line)
         
         # 提取图片
         images = self._extract_images(topic)
         
         # 处理标签
-        tags = self._extract_tags(topic)
+        tags = self._extract_tags(topic, summary_text)
         
         # 处理分类
-        categories = self._determine_categories(topic)
+        categories = self._determine_categories(topic, 'article')
         
         # 获取文章设置
-        post_types = self.config.get('content_mapping', {}).get('post_types', {})
-        article_post_type = post_types.get('article', 'post')
+        article_post_type = self._post_types.get('article', 'post')
         
         # 构建文章数据
         article = {
@@ -246,7 +328,7 @@ class ContentProcessor:
             'is_elite': topic.get('digested', False),  # 是否精华
             'content_type': 'article',  # 标记为文章
             'post_type': article_post_type,  # WordPress文章类型
-            'raw_data': topic,  # 保留原始数据
+            'raw_data': topic if self._keep_raw_data else None,  # 按需保留原始数据
             '_sync_title_disabled': not sync_title  # 传递标题同步禁用标记
         }
         
@@ -262,26 +344,17 @@ class ContentProcessor:
             处理后的主题数据
         """
         topic_id = str(topic.get('topic_id', ''))
-        topic_type = topic.get('type', '')
         
         # 根据主题类型获取内容
-        text_content = ''
-        if topic_type == 'talk' and 'talk' in topic:
-            text_content = topic['talk'].get('text', '')
-        elif topic_type == 'q&a-question' and 'question' in topic:
-            text_content = topic['question'].get('text', '')
-        elif topic_type == 'q&a-answer' and 'answer' in topic:
-            text_content = topic['answer'].get('text', '')
-        elif 'content' in topic:
-            text_content = topic['content'].get('text', '')
+        text_content = self._get_text(topic)
         
         # 生成主题标题 - 根据主题配置决定是否同步标题
-        topic_settings = self.config.get('content_mapping', {}).get('topic_settings', {})
+        topic_settings = self._topic_settings
         sync_title = topic_settings.get('sync_title')
         
         # 向后兼容：如果新配置不存在，使用旧的全局配置
         if sync_title is None:
-            sync_title = self.config.get('sync', {}).get('sync_title', True)
+            sync_title = self._default_sync_title
             
         if sync_title:
             title = self._generate_topic_title(topic, text_content)
@@ -297,21 +370,17 @@ class ContentProcessor:
         images = self._extract_images(topic)
         
         # 处理标签
-        tags = self._extract_tags(topic)
+        tags = self._extract_tags(topic, text_content)
         
         # 处理分类
-        categories = self._determine_categories(topic)
+        categories = self._determine_categories(topic, 'short_content')
         
-        # 获取主题设置
-        topic_settings = self.config.get('content_mapping', {}).get('topic_settings', {})
         # 注意：这里的分类已经在 _determine_categories 中处理了，不需要再次设置
         
-        # 获取post类型设置
-        post_types = self.config.get('content_mapping', {}).get('post_types', {})
         # 检查是否使用自定义文章类型
         use_custom_post_type = topic_settings.get('use_custom_post_type', True)
         if use_custom_post_type:
-            topic_post_type = post_types.get('topic', 'moment')
+            topic_post_type = self._post_types.get('topic', 'moment')
         else:
             topic_post_type = 'post'  # 使用标准文章类型
         
@@ -327,7 +396,7 @@ class ContentProcessor:
             'is_elite': topic.get('digested', False),  # 是否精华
             'content_type': 'short_content',  # 标记为短内容
             'post_type': topic_post_type,  # WordPress文章类型
-            'raw_data': topic,  # 保留原始数据
+            'raw_data': topic if self._keep_raw_data else None,  # 按需保留原始数据
             '_sync_title_disabled': not sync_title  # 传递标题同步禁用标记
         }
         
@@ -344,25 +413,18 @@ class ContentProcessor:
             主题标题
         """
         # 获取配置中的主题设置
-        topic_settings = self.config.get('content_mapping', {}).get('topic_settings', {})
-        max_length = topic_settings.get('max_title_length', 30)
-        title_prefix = topic_settings.get('title_prefix', '[主题]')
+        max_length = self._topic_max_title_length
+        title_prefix = self._topic_title_prefix
         
         if not text_content:
             # 如果没有文本内容，尝试从topic中获取
-            topic_type = topic.get('type', '')
-            if topic_type == 'talk' and 'talk' in topic:
-                text_content = topic['talk'].get('text', '')
-            elif topic_type == 'q&a-question' and 'question' in topic:
-                text_content = topic['question'].get('text', '')
-            elif topic_type == 'q&a-answer' and 'answer' in topic:
-                text_content = topic['answer'].get('text', '')
-            elif 'content' in topic:
-                text_content = topic['content'].get('text', '')
+            text_content = self._get_text(topic)
         
         # 清理文本，去除HTML标签和特殊字符
-        clean_text = self._re_html_tags.sub('', text_content)  # 去除HTML标签
-        clean_text = self._re_whitespace.sub(' ', clean_text).strip()  # 规范化空白字符
+        clean_text = text_content
+        if '<' in clean_text:
+            clean_text = _RE_HTML_TAG.sub('', clean_text)  # 去除HTML标签
+        clean_text = ' '.join(clean_text.split())  # 规范化空白字符
         
         if clean_text:
             # 使用内容前缀作为标题
@@ -372,7 +434,7 @@ class ContentProcessor:
                 # 智能截断：在合适的位置截断
                 title = clean_text[:max_length].rstrip()
                 # 如果截断位置不是句末，添加省略号
-                if not title.endswith(('。', '！', '？', '，', '、')):
+                if not title or title[-1] not in _TITLE_END_PUNCTUATION:
                     title += '…'
             
             # 添加前缀标识
@@ -397,25 +459,19 @@ class ContentProcessor:
         Returns:
             处理后的短内容
         """
-        if not text:
+        # 空白内容处理后必然为空，直接返回
+        if not text or text.isspace():
             return ""
         
         # 清理知识星球页脚
         text = self._remove_zsxq_footer(text)
         
         # 基本的内容处理（比文章处理更简化）
+        processed = text
         
-        # 处理@提及 - 转换为普通文本
-        processed = self._re_mention.sub(r'\1', text)
-        
-        # 处理图片标签 - 优先处理图片，避免被link处理覆盖
-        processed = self._re_image_link.sub(self._replace_image_tag, processed)
-        
-        # 处理话题标签 - 转换为可点击的标签
-        processed = self._process_hashtag_tags(processed)
-        
-        # 使用简化链接处理方式，避免WordPress主题解析问题（短内容处理）
-        processed = self._re_web_link.sub(self._replace_simple_link, processed)
+        # 一次扫描处理@提及、图片、话题标签和链接，纯文本无需扫描
+        if '<e ' in processed:
+            processed = _RE_ENTITY_TAG.sub(self._replace_entity_tag, processed)
         
         # 短内容保持简洁，只转换必要的换行
         processed = processed.replace('\n\n', '</p><p>')
@@ -427,6 +483,35 @@ class ContentProcessor:
         
         return processed
     
+    def _replace_entity_tag(self, match):
+        """替换知识星球实体标签，按标签类型分派
+        
+        - @提及：转换为普通文本
+        - 图片：转换为标准的img标签
+        - 话题：转换为简单的标签文本
+        - 链接：使用简化链接格式，避免WordPress主题解析问题
+        
+        Args:
+            match: _RE_ENTITY_TAG 的匹配对象
+            
+        Returns:
+            替换后的文本
+        """
+        mention = match.group(1)
+        if mention is not None:
+            return mention
+        
+        tag_type = match.group(2)
+        if tag_type == 'hashtag':
+            return self._replace_hashtag_tag(match)
+        
+        # 图片和链接只处理自闭合标签
+        if not match.group(0).endswith('/>'):
+            return match.group(0)
+        if tag_type == 'image':
+            return self._replace_image_tag(match)
+        return self._replace_simple_link(match)
+    
     def _replace_image_tag(self, match):
         """替换图片标签，转换为标准的img标签
         
@@ -439,17 +524,17 @@ class ContentProcessor:
         full_tag = match.group(0)
         
         # 提取src和title属性
-        src_match = re.search(r'src="([^"]*)"', full_tag)
-        title_match = re.search(r'title="([^"]*)"', full_tag)
+        src_match = _RE_SRC_ATTR.search(full_tag)
+        title_match = _RE_TITLE_ATTR.search(full_tag)
         
         if src_match:
             # URL解码
             encoded_url = src_match.group(1)
-            image_url = urllib.parse.unquote(encoded_url)
+            image_url = unquote(encoded_url)
             
             # 获取图片文本（alt属性）
             if title_match:
-                alt_text = urllib.parse.unquote(title_match.group(1))
+                alt_text = unquote(title_match.group(1))
             else:
                 alt_text = '图片'
             
@@ -459,90 +544,72 @@ class ContentProcessor:
             # 如果没有src，返回空字符串
             return ''
     
-    def _process_hashtag_tags(self, text: str) -> str:
-        """处理hashtag标签，转换为简单的标签文本
+    def _replace_hashtag_tag(self, match):
+        """替换hashtag标签，转换为简单的标签文本
         
         Args:
-            text: 原始文本
+            match: 正则匹配对象
             
         Returns:
-            处理后的文本
+            标签文本
         """
-        def replace_hashtag(match):
-            full_tag = match.group(0)
+        full_tag = match.group(0)
+        
+        # 提取title属性（含有hashtag内容）
+        title_match = _RE_TITLE_ATTR.search(full_tag)
+        
+        if title_match:
+            # 解码URL编码的hashtag（%23 = #）
+            encoded_hashtag = title_match.group(1)
+            hashtag = unquote(encoded_hashtag)
             
-            # 提取title属性（含有hashtag内容）
-            title_match = re.search(r'title="([^"]*)"', full_tag)
+            # 移除首尾的#号并清理
+            clean_hashtag = hashtag.strip('#')
             
-            if title_match:
-                # 解码URL编码的hashtag（%23 = #）
-                encoded_hashtag = title_match.group(1)
-                hashtag = urllib.parse.unquote(encoded_hashtag)
-                
-                # 移除首尾的#号并清理
-                clean_hashtag = hashtag.strip('#')
-                
-                if clean_hashtag:
-                    # 返回简单的hashtag文本
-                    return f'#{clean_hashtag}#'
-                else:
-                    return '#'
+            if clean_hashtag:
+                # 返回简单的hashtag文本
+                return f'#{clean_hashtag}#'
             else:
-                # 如果没有title属性，返回空的hashtag
-                return ''
-        
-        # 处理 <e type="hashtag"> 标签
-        processed = re.sub(r'<e type="hashtag"[^>]*/?>', replace_hashtag, text)
-        
-        # 保留原有的简单hashtag处理逻辑（作为后备）
-        processed = self._re_hashtag.sub(r'#\1#', processed)
-        
-        return processed
+                return '#'
+        else:
+            # 如果没有title属性，返回空的hashtag
+            return ''
         
-    def _generate_title(self, topic: Dict[str, Any]) -> str:
+    def _generate_title(self, topic: Dict[str, Any]) -> Tuple[str, Optional[str]]:
         """生成文章标题 - 改进版，智能避免重复
         
         Args:
             topic: 主题数据
             
         Returns:
-            文章标题
+            (文章标题, 标题来源的原始正文行)，标题不是取自正文首行时来源行为None
         """
-        topic_type = topic.get('type', '')
-        
         # 根据主题类型获取文本内容
-        text = ''
-        if topic_type == 'talk' and 'talk' in topic:
-            text = topic['talk'].get('text', '')
-        elif topic_type == 'q&a-question' and 'question' in topic:
-            text = topic['question'].get('text', '')
-        elif topic_type == 'q&a-answer' and 'answer' in topic:
-            text = topic['answer'].get('text', '')
-        elif 'content' in topic:
-            content = topic['content']
-            text = content.get('text', '')
-            # 如果有标题字段，直接使用
-            if content.get('title'):
-                return content['title']
-        
-        # 从内容提取标题
-        lines = text.strip().split('\n')
-        if lines and lines[0]:
-            first_line = lines[0].strip()
-            
+        text_key = self._get_text_key(topic)
+        text = topic[text_key].get('text', '') if text_key else ''
+        
+        # content结构如果有标题字段，直接使用
+        if text_key == 'content' and topic['content'].get('title'):
+            return topic['content']['title'], None
+        
+        # 从内容提取标题（只截取第一行，不拆分整篇正文）
+        stripped = text.lstrip()
+        newline_pos = stripped.find('\n')
+        source_line = (stripped if newline_pos < 0 else stripped[:newline_pos]).strip()
+        if source_line:
             # 处理知识星球HTML标签（仅用于标题，去除格式标记）
-            first_line = self._process_zsxq_tags_for_title(first_line)
+            first_line = self._process_zsxq_tags_for_title(source_line)
             
             # 改进的标题判断逻辑
-            if len(first_line) <= 80 and not first_line.endswith(('。', '！', '？', '，', '、')):
+            if len(first_line) <= 80 and (not first_line or first_line[-1] not in _TITLE_END_PUNCTUATION):
                 # 智能截断：在合适的位置截断，避免简单字符截断
                 if len(first_line) > 50:
                     # 寻找合适的断点（标点符号、空格、冒号等）
-                    breakpoints = ['：', ':', '，', '、', ' ', '-', '－']
+                    # 按优先级逐个查找，只在第20~45个字符范围内搜索
                     best_cut = 30
-                    for bp in breakpoints:
-                        pos = first_line.find(bp, 20)  # 从第20个字符开始找
-                        if 20 <= pos <= 45:  # 在合理范围内
+                    for bp in _TITLE_BREAKPOINTS:
+                        pos = first_line.find(bp, 20, 46)
+                        if pos >= 0:
                             best_cut = pos + 1
                             break
                     
@@ -550,28 +617,25 @@ class ContentProcessor:
                 else:
                     title = first_line
                     
-                # 记录原始第一行，用于后续去重
-                self._title_source_line = lines[0].strip()  # 保存原始未处理的行
-                return title
+                # 同时返回原始未处理的第一行，用于后续去重
+                return title, source_line
                 
         # 如果第一行不适合做标题，尝试提取关键信息
-        clean_text = re.sub(r'\s+', ' ', text).strip()
+        clean_text = ' '.join(text.split())
         if clean_text:
             # 智能提取：寻找句子的主要部分
-            sentences = re.split(r'[。！？]', clean_text)
+            sentences = _RE_SENTENCE_END.split(clean_text)
             if sentences and sentences[0]:
                 first_sentence = sentences[0].strip()
                 if len(first_sentence) <= 50:
                     title = first_sentence
-                    self._title_source_line = None  # 没有对应的原始行
-                    return title
+                    return title, None  # 没有对应的原始行
             
             # 最后的截断方案
             if len(clean_text) > 30:
                 title = clean_text[:30] + '…'
             else:
                 title = clean_text
-            self._title_source_line = None
         else:
             # 使用时间作为标题
             create_time = topic.get('create_time', '')
@@ -580,65 +644,57 @@ class ContentProcessor:
                 title = dt.strftime('%Y年%m月%d日分享')
             else:
                 title = '无标题'
-            self._title_source_line = None
                 
-        return title
+        return title, None
         
-    def _process_content(self, text: str, title: str = "") -> str:
+    def _process_content(self, text: str, title: str = "",
+                         title_source_line: Optional[str] = None) -> str:
         """处理文本内容，转换格式
         
         Args:
             text: 原始文本
             title: 文章标题（用于去重）
+            title_source_line: 生成标题所用的原始正文行（用于去重）
             
         Returns:
             处理后的文本
         """
-        if not text:
+        # 空白内容处理后必然为空，直接返回
+        if not text or text.isspace():
             return ""
         
         # 【增强去重逻辑】智能处理各种重复情况
-        text = self._remove_title_duplication(text, title)
+        text = self._remove_title_duplication(text, title, title_source_line)
         
         # 清理知识星球页脚
         text = self._remove_zsxq_footer(text)
         
-        # 处理知识星球特有的HTML标签
-        processed = self._process_zsxq_tags(text)
-        
-        # 处理@提及 - 转换为普通文本
-        processed = re.sub(r'<e type="mention"[^>]*>(@[^<]+)</e>', r'\1', processed)
-        
-        # 处理图片标签 - 优先处理图片，避免被link处理覆盖
-        processed = self._re_image_link.sub(self._replace_image_tag, processed)
-        
-        # 处理话题标签 - 转换为可点击的标签
-        processed = self._process_hashtag_tags(processed)
-        
-        # 使用简化链接处理方式，避免WordPress主题解析问题（文章内容处理）
-        processed = self._re_web_link.sub(self._replace_simple_link, processed)
+        processed = text
         
-        # 处理换行 - 保持段落结构
-        paragraphs = processed.split('\n\n')
-        formatted_paragraphs = []
+        # 知识星球标签都以 <e 开头，纯文本无需做标签替换
+        if '<e ' in processed:
+            # 处理知识星球特有的HTML标签
+            processed = self._process_zsxq_tags(processed)
+            
+            # 一次扫描处理@提及、图片、话题标签和链接
+            processed = _RE_ENTITY_TAG.sub(self._replace_entity_tag, processed)
         
-        for para in paragraphs:
-            para = para.strip()
-            if para:
-                # 将单个换行转换为<br>
-                para = para.replace('\n', '<br>\n')
-                formatted_paragraphs.append(f'<p>{para}</p>')
-                
-        processed = '\n\n'.join(formatted_paragraphs)
+        # 处理换行 - 保持段落结构，段内单个换行转换为<br>
+        paragraphs = [para.replace('\n', '<br>\n')
+                      for para in map(str.strip, processed.split('\n\n')) if para]
+        # 段落标签作为分隔符一次拼接，不再逐段包装
+        processed = '<p>' + '</p>\n\n<p>'.join(paragraphs) + '</p>' if paragraphs else ''
         
         return processed
     
-    def _remove_title_duplication(self, text: str, title: str) -> str:
+    def _remove_title_duplication(self, text: str, title: str,
+                                  title_source_line: Optional[str] = None) -> str:
         """智能去除正文中与标题重复的内容
         
         Args:
             text: 原始正文
             title: 文章标题
+            title_source_line: 生成标题所用的原始正文行
             
         Returns:
             去重后的正文
@@ -646,51 +702,50 @@ class ContentProcessor:
         if not text or not title:
             return text
             
-        lines = text.strip().split('\n')
-        if not lines or not lines[0]:
+        stripped = text.strip()
+        if not stripped:
             return text
             
-        first_line = lines[0].strip()
+        # 只切出第一行，不拆分整篇正文
+        first_line, _, remaining = stripped.partition('\n')
+        first_line = first_line.strip()
         
         # 检查各种重复情况
-        if self._is_title_duplicate(first_line, title):
-            remaining_lines = lines[1:]
-            return '\n'.join(remaining_lines).strip()
+        if self._is_title_duplicate(first_line, title, title_source_line):
+            return remaining.strip()
             
         return text
     
-    def _is_title_duplicate(self, first_line: str, title: str) -> bool:
+    def _is_title_duplicate(self, first_line: str, title: str,
+                            title_source_line: Optional[str] = None) -> bool:
         """检查第一行是否与标题重复
         
         Args:
             first_line: 正文第一行
             title: 文章标题
+            title_source_line: 生成标题所用的原始正文行
             
         Returns:
             是否重复
         """
-        # 检查是否有记录的原始标题行
-        if hasattr(self, '_title_source_line') and self._title_source_line:
-            if first_line == self._title_source_line:
-                return True
-        
-        # 检查完全匹配
-        if self._exact_match(first_line, title):
+        # 检查是否为生成标题所用的原始行
+        if title_source_line and first_line == title_source_line:
             return True
-            
-        # 检查截断匹配
-        if self._truncated_match(first_line, title):
+        
+        # 检查完全匹配/截断匹配：去掉标题末尾的省略号后做前缀比较
+        clean_title = title.rstrip('…..')
+        if first_line.startswith(clean_title):
             return True
             
         # 检查模糊匹配
-        if self._fuzzy_match(first_line, title):
-            return True
-            
-        return False
+        return self._fuzzy_match(first_line, clean_title)
     
     def _process_zsxq_tags(self, text: str) -> str:
         """处理知识星球特有的HTML标签
         
+        粗体、斜体、删除线转换为Markdown格式标记，其他未知的e标签提取title内容，
+        一次扫描完成。
+        
         Args:
             text: 原始文本
             
@@ -699,23 +754,20 @@ class ContentProcessor:
         """
         if not text:
             return text
-            
-        # 处理文本格式标签
-        processed = text
-        
-        # 处理粗体标签 <e type="text_bold" title="文本内容" />
-        processed = self._re_text_bold.sub(lambda m: f'**{urllib.parse.unquote(m.group(1))}**', processed)
-        
-        # 处理斜体标签 <e type="text_italic" title="文本内容" />
-        processed = self._re_text_italic.sub(lambda m: f'*{urllib.parse.unquote(m.group(1))}*', processed)
         
-        # 处理删除线标签 <e type="text_delete" title="文本内容" />
-        processed = self._re_text_delete.sub(lambda m: f'~~{urllib.parse.unquote(m.group(1))}~~', processed)
-        
-        # 处理其他未知的e标签，提取title内容并解码
-        processed = self._re_text_generic.sub(lambda m: urllib.parse.unquote(m.group(1)), processed)
+        return _RE_TEXT_FORMAT_TAG.sub(self._replace_text_format_tag, text)
+    
+    def _replace_text_format_tag(self, match):
+        """替换文本格式标签，添加对应的格式标记
         
-        return processed
+        Args:
+            match: _RE_TEXT_FORMAT_TAG 的匹配对象
+            
+        Returns:
+            带格式标记的解码文本
+        """
+        marker = _TEXT_FORMAT_MARKERS.get(match.group(1), '')
+        return f'{marker}{unquote(match.group(2))}{marker}'
     
     def _process_zsxq_tags_for_title(self, text: str) -> str:
         """处理知识星球特有的HTML标签（用于标题，不添加格式标记）
@@ -728,23 +780,9 @@ class ContentProcessor:
         """
         if not text:
             return text
-            
-        # 处理文本格式标签，直接提取内容，不加格式标记
-        processed = text
-        
-        # 处理粗体标签，只提取文本内容
-        processed = self._re_text_bold.sub(lambda m: urllib.parse.unquote(m.group(1)), processed)
-        
-        # 处理斜体标签，只提取文本内容
-        processed = self._re_text_italic.sub(lambda m: urllib.parse.unquote(m.group(1)), processed)
         
-        # 处理删除线标签，只提取文本内容
-        processed = self._re_text_delete.sub(lambda m: urllib.parse.unquote(m.group(1)), processed)
-        
-        # 处理其他未知的e标签，提取title内容并解码
-        processed = self._re_text_generic.sub(lambda m: urllib.parse.unquote(m.group(1)), processed)
-        
-        return processed
+        # 所有文本格式标签都只提取解码后的title内容
+        return _RE_TEXT_FORMAT_TAG.sub(lambda m: unquote(m.group(2)), text)
     
     def _remove_zsxq_footer(self, text: str) -> str:
         """移除知识星球页脚信息
@@ -759,8 +797,9 @@ class ContentProcessor:
             return text
             
         cleaned_text = text
-        for pattern in self._re_footer_patterns:
-            cleaned_text = pattern.sub('', cleaned_text)
+        # 页脚都包含“发布于”，先做子串检查，避免无页脚时的正则扫描
+        if '发布于' in cleaned_text:
+            cleaned_text = _RE_ZSXQ_FOOTER.sub('', cleaned_text)
         
         # 清理末尾的多余空白
         cleaned_text = cleaned_text.rstrip()
@@ -779,17 +818,17 @@ class ContentProcessor:
         full_tag = match.group(0)
         
         # 提取href和title属性
-        href_match = self._re_href.search(full_tag)
-        title_match = self._re_title.search(full_tag)
+        href_match = _RE_HREF_ATTR.search(full_tag)
+        title_match = _RE_TITLE_ATTR.search(full_tag)
         
         if href_match:
             # URL解码
             encoded_url = href_match.group(1)
-            url = urllib.parse.unquote(encoded_url)
+            url = unquote(encoded_url)
             
             # 获取链接文本
             if title_match:
-                link_text = urllib.parse.unquote(title_match.group(1))
+                link_text = unquote(title_match.group(1))
             else:
                 link_text = url
             
@@ -815,17 +854,17 @@ class ContentProcessor:
         full_tag = match.group(0)
         
         # 提取href和title属性
-        href_match = self._re_href.search(full_tag)
-        title_match = self._re_title.search(full_tag)
+        href_match = _RE_HREF_ATTR.search(full_tag)
+        title_match = _RE_TITLE_ATTR.search(full_tag)
         
         if href_match:
             # URL解码
             encoded_url = href_match.group(1)
-            url = urllib.parse.unquote(encoded_url)
+            url = unquote(encoded_url)
             
             # 获取链接文本
             if title_match:
-                link_text = urllib.parse.unquote(title_match.group(1))
+                link_text = unquote(title_match.group(1))
             else:
                 link_text = url
             
@@ -850,59 +889,44 @@ class ContentProcessor:
         if not url:
             return False
             
-        # 图片文件扩展名
-        image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp', '.svg', '.ico'}
-        
-        # 获取URL的路径部分（去除查询参数）
-        parsed = urlparse(url.lower())
-        path = parsed.path
+        url_lower = url.lower()
         
-        # 检查文件扩展名
-        for ext in image_extensions:
-            if path.endswith(ext):
+        # 检查文件扩展名：只有URL中出现扩展名时路径才可能以其结尾，
+        # 多数普通链接无需urlparse。urlparse会删除制表符和换行符，
+        # 含不可打印字符时同样交给urlparse处理
+        if not url_lower.isprintable() or _RE_IMAGE_EXTENSION.search(url_lower):
+            # 获取URL的路径部分（去除查询参数）
+            if urlparse(url_lower).path.endswith(_IMAGE_EXTENSIONS):
                 return True
                 
         # 检查是否包含常见的图片服务域名或路径模式
-        image_patterns = [
-            'qpic.cn',           # 知识星球图片域名
-            'images.',           # 常见图片子域名
-            'img.',              # 常见图片子域名
-            '/images/',          # 图片路径
-            '/img/',             # 图片路径
-            'imagecdn.',         # 图片CDN
-            'imgcdn.',           # 图片CDN
-        ]
-        
-        url_lower = url.lower()
-        for pattern in image_patterns:
+        for pattern in _IMAGE_URL_HINTS:
             if pattern in url_lower:
                 return True
                 
         return False
     
-    def _exact_match(self, first_line: str, title: str) -> bool:
-        """检查完全匹配"""
-        return first_line.startswith(title.rstrip('…..'))
-    
-    def _truncated_match(self, first_line: str, title: str) -> bool:
-        """检查截断匹配"""
-        clean_title = title.rstrip('…..')
-        return (first_line.startswith(clean_title) and 
-                len(clean_title) >= 10)
-    
-    def _fuzzy_match(self, first_line: str, title: str) -> bool:
-        """检查模糊匹配（忽略标点符号）"""
-        clean_title = title.rstrip('…..')
+    def _fuzzy_match(self, first_line: str, clean_title: str) -> bool:
+        """检查模糊匹配（忽略标点符号）
+        
+        Args:
+            first_line: 正文第一行
+            clean_title: 已去除末尾省略号的标题
+            
+        Returns:
+            是否匹配
+        """
         # 移除标点符号进行比较
-        title_clean = self._re_punctuation.sub('', clean_title)
-        first_line_clean = self._re_punctuation.sub('', first_line)
+        title_clean = _RE_PUNCTUATION.sub('', clean_title)
         
-        return (title_clean and 
-                first_line_clean.startswith(title_clean) and 
-                len(title_clean) >= 8)
+        # 标题过短时不做模糊匹配，也就无需处理正文行
+        if len(title_clean) < 8:
+            return False
+        
+        return _RE_PUNCTUATION.sub('', first_line).startswith(title_clean)
         
     def _extract_images(self, topic: Dict[str, Any]) -> List[str]:
-        """提取主题中的图片URL - 增强版，递归搜索所有可能的图片字段
+        """提取主题中的图片URL - 增强版，搜索所有可能的图片字段
         
         Args:
             topic: 主题数据
@@ -910,61 +934,67 @@ class ContentProcessor:
         Returns:
             图片URL列表
         """
-        images = []
-        
-        # 根据主题类型提取图片
-        topic_type = topic.get('type', '')
-        
-        def extract_image_urls(data, path="root"):
-            """递归提取图片URL"""
-            urls = []
-            if isinstance(data, dict):
-                # 查找images字段
-                if 'images' in data:
-                    images_data = data['images']
-                    if isinstance(images_data, list):
-                        for i, img in enumerate(images_data):
-                            if isinstance(img, dict):
-                                # 优先级：large > original > thumbnail > url
-                                for size in ['large', 'original', 'thumbnail']:
-                                    if size in img and isinstance(img[size], dict) and 'url' in img[size]:
-                                        url = img[size]['url']
-                                        urls.append(url)
-                                        break
-                                else:
-                                    # 直接包含url字段
-                                    if 'url' in img:
-                                        url = img['url']
-                                        urls.append(url)
-                            elif isinstance(img, str) and img.startswith('http'):
-                                # 直接是URL字符串
-                                urls.append(img)
-                
-                # 递归搜索其他字段
-                for key, value in data.items():
-                    if key != 'images' and isinstance(value, (dict, list)):
-                        urls.extend(extract_image_urls(value, f"{path}.{key}"))
-            elif isinstance(data, list):
-                for i, item in enumerate(data):
-                    urls.extend(extract_image_urls(item, f"{path}[{i}]"))
-            
-            return urls
-        
-        # 使用递归方法提取所有图片
-        images = extract_image_urls(topic)
+        images = self._collect_image_urls(topic)
         
         # 如果有完整文章的图片，也要添加进来
         if '_full_article_images' in topic:
-            full_article_images = extract_image_urls({'images': topic['_full_article_images']})
-            images.extend(full_article_images)
+            images.extend(self._collect_image_urls({'images': topic['_full_article_images']}))
             
         return images
+    
+    def _collect_image_urls(self, data: Any) -> List[str]:
+        """深度优先遍历数据，收集所有images字段中的图片URL
+        
+        使用显式栈代替递归，按原先递归的先序顺序输出。数据来自JSON解析，
+        只会是内置的dict/list/str，因此用 type() is 做类型判断。
         
-    def _extract_tags(self, topic: Dict[str, Any]) -> List[str]:
+        Args:
+            data: 主题数据或其中的嵌套结构
+            
+        Returns:
+            图片URL列表
+        """
+        urls = []
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            node_type = type(node)
+            if node_type is dict:
+                # 查找images字段
+                images_data = node.get('images')
+                if type(images_data) is list:
+                    for img in images_data:
+                        img_type = type(img)
+                        if img_type is dict:
+                            # 优先级：large > original > thumbnail > url
+                            for size in ('large', 'original', 'thumbnail'):
+                                sized = img.get(size)
+                                if type(sized) is dict and 'url' in sized:
+                                    urls.append(sized['url'])
+                                    break
+                            else:
+                                # 直接包含url字段
+                                if 'url' in img:
+                                    urls.append(img['url'])
+                        elif img_type is str and img.startswith('http'):
+                            # 直接是URL字符串
+                            urls.append(img)
+                
+                # 继续搜索其他字段，逆序入栈以保持原有遍历顺序
+                children = [value for key, value in node.items()
+                            if key != 'images' and (type(value) is dict or type(value) is list)]
+                stack.extend(reversed(children))
+            elif node_type is list:
+                stack.extend(reversed(node))
+        
+        return urls
+        
+    def _extract_tags(self, topic: Dict[str, Any], text_content: Optional[str] = None) -> List[str]:
         """提取标签
         
         Args:
             topic: 主题数据
+            text_content: 主题正文，调用方已获取时传入以避免重复查找
             
         Returns:
             标签列表
@@ -972,62 +1002,49 @@ class ContentProcessor:
         tags = []
         
         # 根据主题类型获取文本内容
-        topic_type = topic.get('type', '')
-        text_content = ''
-        
-        if topic_type == 'talk' and 'talk' in topic:
-            text_content = topic['talk'].get('text', '')
-        elif topic_type == 'q&a-question' and 'question' in topic:
-            text_content = topic['question'].get('text', '')
-        elif topic_type == 'q&a-answer' and 'answer' in topic:
-            text_content = topic['answer'].get('text', '')
-        elif 'content' in topic:
-            text_content = topic['content'].get('text', '')
+        if text_content is None:
+            text_content = self._get_text(topic)
         
         if not text_content:
             return tags
         
         # 方法1: 提取HTML格式的hashtag标签
         # 格式: <e type="hashtag" hid="xxx" title="%23标签名%23" />
-        html_tags = self._re_hashtag_html.findall(text_content)
-        for tag in html_tags:
-            # 解码URL编码 (%23 = #)
-            decoded_tag = urllib.parse.unquote(tag)
-            # 移除首尾的#号
-            clean_tag = decoded_tag.strip('#')
-            if clean_tag:
-                tags.append(clean_tag)
+        if '<e type="hashtag"' in text_content:
+            for match in _RE_HASHTAG_HTML.finditer(text_content):
+                # 解码URL编码 (%23 = #)
+                decoded_tag = unquote(match.group(1))
+                # 移除首尾的#号
+                clean_tag = decoded_tag.strip('#')
+                if clean_tag:
+                    tags.append(clean_tag)
         
         # 方法2: 提取普通的#标签#格式
-        hashtags = self._re_hashtag_plain.findall(text_content)
-        for tag in hashtags:
-            tags.append(tag)
+        if '#' in text_content:
+            tags.extend(_RE_HASHTAG_PLAIN.findall(text_content))
         
         # 如果是精华内容，添加精华标签
         if topic.get('digested', False):
             tags.append('精华')
             
-        # 去重
-        unique_tags = list(set(tags))
-        
-        return unique_tags
+        # 去重（保持标签在正文中出现的顺序）
+        return list(dict.fromkeys(tags))
         
-    def _determine_categories(self, topic: Dict[str, Any]) -> List[str]:
+    def _determine_categories(self, topic: Dict[str, Any],
+                              content_type: Optional[str] = None) -> List[str]:
         """确定文章分类（基于专栏映射）
         
         Args:
             topic: 主题数据
+            content_type: 已确定的内容类型，未传入时重新判断
             
         Returns:
             分类列表
         """
         categories = []
         
-        # 获取配置
-        config_mapping = self.config.get('content_mapping', {})
-        
         # 如果启用了专栏映射且topic有专栏信息
-        if (config_mapping.get('enable_column_mapping', False) and
+        if (self._content_mapping.get('enable_column_mapping', False) and
             hasattr(topic, '_column_name') and topic._column_name):
             categories.append(topic._column_name)
         elif '_column_name' in topic and topic['_column_name']:
@@ -1035,7 +1052,7 @@ class ContentProcessor:
             categories.append(topic['_column_name'])
         
         # 添加特殊分类：精华、置顶
-        special_categories = config_mapping.get('special_categories', {})
+        special_categories = self._special_categories
         if topic.get('digested', False):  # 精华
             digested_category = special_categories.get('digested', '精华')
             categories.append(digested_category)
@@ -1044,14 +1061,15 @@ class ContentProcessor:
             categories.append(sticky_category)
         
         # 确定内容类型，获取对应的默认分类
-        content_type = self._determine_content_type(topic)
+        if content_type is None:
+            content_type = self._determine_content_type(topic)
         if content_type == 'article':
             # 文章类型使用 article_settings 中的分类
-            article_settings = config_mapping.get('article_settings', {})
+            article_settings = self._article_settings
             default_category = article_settings.get('default_classification', article_settings.get('category', 'Trending'))
         else:
             # 主题类型使用 topic_settings 中的分类
-            topic_settings = config_mapping.get('topic_settings', {})
+            topic_settings = self._topic_settings
             default_category = topic_settings.get('default_classification', topic_settings.get('category', 'Trending'))
         
         # 如果没有分类，使用内容类型对应的默认分类
@@ -1078,35 +1096,30 @@ class ContentProcessor:
         for original_url, new_url in processed_images.items():
             content = content.replace(original_url, new_url)
         
+        # 各部分先收集再一次性拼接，避免长文多次追加时反复复制整个正文
+        parts = [content]
+        
         # 如果有图片，将其添加到内容中
         if article['images']:
-            image_html = []
-            for original_url in article['images']:
-                new_url = processed_images.get(original_url, original_url)
-                # 使用标准的img标签
-                image_html.append(f'<img src="{new_url}" alt="图片">')
-                
             # 将图片添加到内容末尾，每个图片独立成段
-            if image_html:
-                content += '\n\n<p>' + '</p>\n\n<p>'.join(image_html) + '</p>'
+            get_url = processed_images.get
+            parts.extend(_IMG_PARAGRAPH_TEMPLATE % get_url(url, url) for url in article['images'])
                 
         # 根据配置决定是否添加来源说明
-        add_source_footer = self.config.get('sync', {}).get('add_source_footer', False)
-        
-        if add_source_footer:
+        if self._add_source_footer:
             create_time = article.get('create_time', '')
             if create_time:
                 dt = parse_datetime_safe(create_time)
                 time_str = dt.strftime('%Y-%m-%d %H:%M:%S')
                 
                 # 从配置中获取知识星球信息
-                source_config = self.config.get('source', {})
-                source_name = source_config.get('name', '知识星球')
-                source_url = source_config.get('url', '')
+                source_name = self._source_name
+                source_url = self._source_url
                 
                 if source_url:
-                    content += f'\n\n<p class="post-meta">—— 发布于 <a href="{source_url}" target="_blank">{source_name}</a> {time_str}</p>'
+                    parts.append(f'\n\n<p class="post-meta">—— 发布于 <a href="{source_url}" target="_blank">{source_name}</a> {time_str}</p>')
                 else:
-                    content += f'\n\n<p class="post-meta">—— 发布于 {source_name} {time_str}</p>'
+                    parts.append(f'\n\n<p class="post-meta">—— 发布于 {source_name} {time_str}</p>')
             
-        return content
\ No newline at end of file
+        return ''.join(parts)
+
@@ -20,6 +20,11 @@ class SensitiveFilter(logging.Filter):
         super().__init__()
         self.patterns = patterns or []
         self._init_default_patterns()
+        # 每条日志都要经过全部模式，预先编译避免每次调用查找re缓存
+        self._compiled_patterns = [
+            (re.compile(pattern, re.IGNORECASE), replacement)
+            for pattern, replacement in self.patterns
+        ]
         
     def _init_default_patterns(self):
         """初始化默认的敏感信息模式"""
@@ -60,8 +65,8 @@ class SensitiveFilter(logging.Filter):
         """
         if hasattr(record, 'msg'):
             msg = str(record.msg)
-            for pattern, replacement in self.patterns:
-                msg = re.sub(pattern, replacement, msg, flags=re.IGNORECASE)
+            for pattern, replacement in self._compiled_patterns:
+                msg = pattern.sub(replacement, msg)
             record.msg = msg
             
         # 处理args中的敏感信息
@@ -69,8 +74,8 @@ class SensitiveFilter(logging.Filter):
             filtered_args = []
             for arg in record.args:
                 arg_str = str(arg)
-                for pattern, replacement in self.patterns:
-                    arg_str = re.sub(pattern, replacement, arg_str, flags=re.IGNORECASE)
+                for pattern, replacement in self._compiled_patterns:
+                    arg_str = pattern.sub(replacement, arg_str)
                 filtered_args.append(arg_str)
             record.args = tuple(filtered_args)
             
@@ -248,7 +248,7 @@ class QiniuUploader:
                 try:
                     original_url, new_url = future.result()
                     result_map[original_url] = new_url
-                    self.logger.debug(f"批量处理完成: {original_url} -> {new_url}")
+                    self.logger.debug("批量处理完成: %s -> %s", original_url, new_url)
                 except Exception as e:
                     url = futures[future]
                     self.logger.error(f"处理图片时发生异常: {url}, 错误: {e}")
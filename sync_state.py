@@ -7,9 +7,34 @@ import json
 import os
 import shutil
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 import logging
 
+try:
+    # ijson 可流式解析大型状态文件；未安装时回退到 json.load
+    import ijson
+except ImportError:
+    ijson = None
+
+
+def iter_synced_topics(state_file: str = "sync_state.json") -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """逐条读取状态文件中已同步的主题（只读，供分析脚本使用）
+    
+    Args:
+        state_file: 状态文件路径
+        
+    Returns:
+        (topic_id, sync_info) 迭代器，文件不存在时为空
+    """
+    try:
+        with open(state_file, 'rb') as f:
+            if ijson is not None:
+                yield from ijson.kvitems(f, 'synced_topics')
+            else:
+                yield from json.load(f).get('synced_topics', {}).items()
+    except FileNotFoundError:
+        return
+
 
 class SyncStateError(Exception):
     """同步状态相关错误"""
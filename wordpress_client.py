@@ -8,40 +8,8 @@ import ssl
 import urllib3
 from typing import List, Dict, Any, Optional
 import warnings
-from datetime import datetime
 
-
-def parse_datetime_safe(date_string: str) -> datetime:
-    """安全解析日期时间字符串，处理各种时区格式
-    
-    Args:
-        date_string: 日期时间字符串
-        
-    Returns:
-        解析后的datetime对象
-    """
-    if not date_string:
-        raise ValueError("日期字符串不能为空")
-    
-    # 处理Z结尾的UTC时间
-    if date_string.endswith('Z'):
-        date_string = date_string.replace('Z', '+00:00')
-    
-    # 处理+HHMM格式的时区，转换为+HH:MM格式
-    import re
-    # 匹配形如 +0800 或 -0800 的时区格式
-    tz_pattern = r'([+-])(\d{2})(\d{2})$'
-    match = re.search(tz_pattern, date_string)
-    if match:
-        sign, hours, minutes = match.groups()
-        # 替换为标准格式 +HH:MM
-        standard_tz = f'{sign}{hours}:{minutes}'
-        date_string = re.sub(tz_pattern, standard_tz, date_string)
-    
-    try:
-        return datetime.fromisoformat(date_string)
-    except ValueError as e:
-        raise ValueError(f"无法解析日期时间字符串 '{date_string}': {e}")
+from content_processor import parse_datetime_safe
 
 # Python 3.9+ 兼容性修复
 import collections.abc
@@ -230,13 +198,13 @@ class WordPressClient(PublishClient):
             # moment类型使用moments分类法
             moment_categories = content_data.get('categories', [])
             if moment_categories:
-                self.logger.info(f"[DEBUG] moment类型使用moments分类法: {moment_categories}")
+                self.logger.debug("moment类型使用moments分类法: %s", moment_categories)
             else:
-                self.logger.info(f"[DEBUG] moment类型未设置分类")
+                self.logger.debug("moment类型未设置分类")
         else:
             # 非moment类型使用标准category分类法
             categories = content_data.get('categories', ['片刻'])
-            self.logger.info(f"[DEBUG] 标准文章类型使用category分类法: {categories}")
+            self.logger.debug("标准文章类型使用category分类法: %s", categories)
         
         return self.create_post(
             title=title,
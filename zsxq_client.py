@@ -10,6 +10,12 @@ from datetime import datetime
 import logging
 from interfaces import ContentClient
 
+try:
+    # orjson 为 Rust 实现，解析API响应比标准库 json 快数倍；未安装时回退到 response.json()
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
 
 class ZsxqAPIError(Exception):
     """知识星球API错误"""
@@ -73,11 +79,11 @@ class ZsxqClient(ContentClient):
         
         for attempt in range(self.max_retries):
             try:
-                self.logger.debug(f"发起请求: {method} {url}, 尝试 {attempt + 1}/{self.max_retries}")
+                self.logger.debug("发起请求: %s %s, 尝试 %s/%s", method, url, attempt + 1, self.max_retries)
                 response = self.session.request(method, url, **kwargs)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = self._decode_json(response)
                     # 知识星球API可能不总是返回succeeded字段，需要检查code字段
                     if data.get('succeeded', True) and data.get('code', 0) != 401:
                         return data
@@ -116,6 +122,24 @@ class ZsxqClient(ContentClient):
                 
         raise ZsxqAPIError(f"请求失败，已重试{self.max_retries}次: {last_error}")
         
+    @staticmethod
+    def _decode_json(response: requests.Response) -> Dict[str, Any]:
+        """解析响应JSON，优先使用orjson
+        
+        Args:
+            response: HTTP响应
+            
+        Returns:
+            响应数据
+        """
+        if _orjson is not None:
+            try:
+                return _orjson.loads(response.content)
+            except _orjson.JSONDecodeError:
+                # 非UTF-8或格式错误时交给requests处理，保持原有的异常类型和重试行为
+                pass
+        return response.json()
+        
     def validate_connection(self) -> bool:
         """验证连接是否有效
         
@@ -476,7 +500,7 @@ class ZsxqClient(ContentClient):
                 
                 if column_id and column_name:
                     mapping[column_name] = column_id
-                    self.logger.debug(f"发现专栏: {column_name} -> {column_id}")
+                    self.logger.debug("发现专栏: %s -> %s", column_name, column_id)
             
             self.logger.info(f"成功获取 {len(mapping)} 个专栏映射")
             return mapping